@@ -2,10 +2,22 @@
 Scrabble work
 """
 
+import os
 import re
-from collections import Counter
+from functools import lru_cache, wraps
+from types import MethodType
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pandas.api.extensions import take
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; rack_mask falls back to NumPy
+    njit = None
+    prange = range
 
 # Points and tile distribution
 # '?' represents the blank tiles
@@ -20,6 +32,132 @@ DISTRIB_EN = {
     'S': 4, 'T': 6, 'U': 4, 'V': 2, 'W': 2, 'X': 1, 'Y': 2, 'Z': 1, '?': 2,
 }
 
+# Byte -> letter-count column: letters of either case are 0-25, any other
+# character is 26 and the zero padding byte is 27 (dropped after counting)
+LETTER_CODES = np.full(256, 26, dtype=np.intp)
+LETTER_CODES[ord('A'):ord('Z') + 1] = np.arange(26)
+LETTER_CODES[ord('a'):ord('z') + 1] = np.arange(26)
+LETTER_CODES[0] = 27
+
+# Byte -> tile points, for either case; padding and other characters score 0
+POINTS_LUT = np.zeros(256, dtype=np.int16)
+for char, points in POINTS_EN.items():
+    POINTS_LUT[[ord(char), ord(char.lower())]] = points
+
+# Characters that cannot be stored as a single ASCII byte
+NON_ASCII = re.compile(r'[^\x00-\x7f]')
+
+# Valid racks: letters and '?' blanks
+RACK_PATTERN = re.compile(r'[A-Z?]*')
+
+# Underscore patterns made only of letters and blanks, e.g. '__O_E_O__'
+POSITION_PATTERN = re.compile(r'[A-Z_]+')
+
+# Files written by Loader.load_merged_cached; group 1 is the cache stem
+CACHE_FILE_PATTERN = re.compile(
+    r'(merged_\d+_\d+)(?:\.parquet|_(?:letter_counts|word_lengths)\.npy)'
+)
+
+
+def encode_words(words):
+    """
+    Encode words as a zero-padded (n_words, max_len) uint8 matrix, one byte
+    per character. Non-ASCII characters become DEL (0x7f), a non-letter.
+    """
+    words = np.asarray(words, dtype=object)
+    try:
+        encoded = words.astype(bytes)
+    except UnicodeEncodeError:
+        encoded = np.array(
+            [NON_ASCII.sub('\x7f', word) for word in words], dtype=object
+        ).astype(bytes)
+    return encoded.view(np.uint8).reshape(len(encoded), encoded.itemsize)
+
+
+def count_letters(char_mat):
+    """Count letters per row of a char matrix into a (n_rows, 27) matrix."""
+    n = len(char_mat)
+    codes = LETTER_CODES[char_mat] + 28 * np.arange(n)[:, None]
+    counts = np.bincount(codes.ravel(), minlength=28 * n)
+    return counts.reshape(n, 28)[:, :27].astype(np.uint8)
+
+
+def _rack_mask_numpy(counts, rack_vec, blanks):
+    """Flag the rows of a letter-count matrix that a rack can form."""
+    missing = np.subtract(counts, rack_vec, dtype=np.int16)
+    np.maximum(missing, 0, out=missing)
+    return missing.sum(axis=1) <= blanks
+
+
+def _rack_mask_numba(counts, rack_vec, blanks):
+    """
+    Flag the rows of a letter-count matrix that a rack can form, one row at
+    a time and without a temporary deficit matrix. Compiled with Numba.
+    """
+    n = counts.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        deficit = 0
+        for j in range(counts.shape[1]):
+            # Branchless max(0, missing), compiled to a select
+            missing = np.int16(counts[i, j]) - rack_vec[j]
+            deficit += max(missing, 0)
+        out[i] = deficit <= blanks
+    return out
+
+
+if njit is not None:
+    rack_mask = njit(parallel=True, cache=True)(_rack_mask_numba)
+else:
+    rack_mask = _rack_mask_numpy
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern):
+    """Translate an uppercase 'Scrabble regex' into a compiled regex."""
+    pattern = pattern.replace('_', '.{1}')
+    return re.compile(f"^{pattern}$")
+
+
+def parse_zyzzyva(data):
+    """
+    Split the lines of a Zyzzyva lexicon, 'WORD definition [forms]', into
+    word, definition and forms Arrow arrays. `data` is the file content as
+    read in text mode, so with newline line endings; every step is an Arrow
+    compute kernel, so no Python code runs per line.
+    """
+    text = pa.scalar(data, type=pa.string())
+    lines = pc.utf8_trim_whitespace(pc.split_pattern(text, '\n').values)
+    lines = lines.filter(pc.not_equal(lines, ''))
+
+    # A trailing space guarantees every line splits into word and rest.
+    # Words are uppercased once here so loaded lexicons match uppercase
+    # patterns; the byte lookup tables still fold case for hand-built data
+    parts = pc.split_pattern(
+        pc.binary_join_element_wise(lines, ' ', ''), ' ', max_splits=1
+    )
+    word = pc.utf8_upper(pc.list_element(parts, 0))
+    rest = pc.utf8_trim_whitespace(pc.list_element(parts, 1))
+
+    # Forms are the last bracketed group, when it ends the line. A leading
+    # '[' guarantees every rest splits into head and tail
+    has_forms = pc.and_(
+        pc.ends_with(rest, ']'), pc.match_substring(rest, '[')
+    )
+    parts = pc.split_pattern(
+        pc.binary_join_element_wise('[', rest, ''),
+        '[', max_splits=1, reverse=True,
+    )
+    head = pc.list_element(parts, 0)
+    tail = pc.list_element(parts, 1)
+    definition = pc.if_else(
+        has_forms,
+        pc.utf8_rtrim_whitespace(pc.utf8_slice_codeunits(head, 1)),
+        rest,
+    )
+    forms = pc.if_else(has_forms, pc.utf8_rtrim(tail, ']'), None)
+    return word, definition, forms
+
 
 class Loader:
     CSW_PATH = (
@@ -33,6 +171,14 @@ class Loader:
     CSV_PATH = (
         r"C:\Users\dgmat\Documents\Abel\scrabble_words.csv"
     )
+    PARQUET_PATH = (
+        r"C:\Users\dgmat\Documents\Abel\scrabble_words.parquet"
+    )
+    CACHE_DIR = (
+        r"C:\Users\dgmat\Documents\Abel\cache"
+    )
+    # Derived Scrabble arrays saved next to the cached lexicon
+    CACHED_ARRAYS = ['letter_counts', 'word_lengths']
 
     def __init__(self):
         """Initialize the Loader instance with empty attributes."""
@@ -62,7 +208,7 @@ class Loader:
         """Load the merged lexicon from a CSV file into a Scrabble object."""
         try:
             df = pd.read_csv(self.CSV_PATH)
-            self.data = Scrabble(df)
+            self.data = Scrabble.from_raw(df)
         except FileNotFoundError:
             print(f"Error: The file {self.CSV_PATH} was not found.")
             self.data = None  # Return None in case of failure
@@ -71,6 +217,19 @@ class Loader:
             self.data = None
         return self.data
 
+    def load_parquet(self):
+        """Load the merged lexicon from a Parquet file."""
+        try:
+            df = pd.read_parquet(self.PARQUET_PATH, engine='pyarrow')
+            self.data = Scrabble(df)
+        except FileNotFoundError:
+            print(f"Error: The file {self.PARQUET_PATH} was not found.")
+            self.data = None  # Return None in case of failure
+        except Exception as e:
+            print(f"Error loading merged lexicon from Parquet: {e}")
+            self.data = None
+        return self.data
+
     def create_merged(self):
         """Create and return merged lexicon DataFrame with CSW and NWL."""
         if self.CSW is None or self.NWL is None:
@@ -86,6 +245,61 @@ class Loader:
         self.load_nwl()  # Load NWL lexicon
         return self.create_merged()  # Merge and return the lexicons
 
+    def load_merged_cached(self, cache_dir=None):
+        """
+        Load the merged lexicon from a Parquet cache keyed on the modification
+        times of the CSW and NWL files, rebuilding it when either changes.
+        """
+        cache_dir = self.CACHE_DIR if cache_dir is None else cache_dir
+        try:
+            csw_mtime = os.stat(self.CSW_PATH).st_mtime_ns
+            nwl_mtime = os.stat(self.NWL_PATH).st_mtime_ns
+        except OSError as e:
+            print(f"Error: lexicon file not found: {e}")
+            self.data = None  # Return None in case of failure
+            return self.data
+        stem = os.path.join(cache_dir, f"merged_{csw_mtime}_{nwl_mtime}")
+
+        if os.path.exists(f"{stem}.parquet"):
+            try:
+                df = pd.read_parquet(f"{stem}.parquet", engine='pyarrow')
+                arrays = {
+                    name: np.load(f"{stem}_{name}.npy")
+                    for name in self.CACHED_ARRAYS
+                }
+                if any(len(array) != len(df) for array in arrays.values()):
+                    raise ValueError("cached arrays do not match the data")
+            except Exception as e:
+                # Treat an unreadable cache as a miss and rebuild it
+                print(f"Error loading lexicon cache, rebuilding: {e}")
+            else:
+                self.data = Scrabble(df)
+                self.data._derived_cache = (self.data.index, arrays)
+                return self.data
+
+        self.load_merged()
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Arrays first, so that the Parquet file marks a full cache
+            for name in self.CACHED_ARRAYS:
+                np.save(f"{stem}_{name}.npy", getattr(self.data, f"_{name}"))
+            self.data.to_parquet(f"{stem}.parquet", engine='pyarrow')
+            self._remove_stale_cache(cache_dir, stem)
+        except Exception as e:
+            print(f"Error saving lexicon cache: {e}")
+        return self.data
+
+    def _remove_stale_cache(self, cache_dir, stem):
+        """
+        Delete cached lexicon files other than those of `stem`. Only names
+        generated by load_merged_cached are touched.
+        """
+        prefix = os.path.basename(stem)
+        for filename in os.listdir(cache_dir):
+            match = CACHE_FILE_PATTERN.fullmatch(filename)
+            if match and match.group(1) != prefix:
+                os.remove(os.path.join(cache_dir, filename))
+
     def to_csv(self, df):
         """Save the provided DataFrame to a CSV file."""
         try:
@@ -94,74 +308,216 @@ class Loader:
         except Exception as e:
             print(f"Error saving to CSV: {e}")
 
+    def to_parquet(self, df):
+        """Save the provided DataFrame to a Parquet file."""
+        try:
+            df.to_parquet(self.PARQUET_PATH, engine='pyarrow')
+            print(f"Data saved to {self.PARQUET_PATH}")
+        except Exception as e:
+            print(f"Error saving to Parquet: {e}")
+
+
+class ScrabbleIndexer:
+    """
+    Proxy for a DataFrame indexer (loc, iloc, at, iat) of a Scrabble that
+    wraps DataFrame results back into a Scrabble.
+    """
+
+    def __init__(self, scrabble, name):
+        self.scrabble = scrabble
+        self.name = name
+
+    def __getitem__(self, key):
+        indexer = getattr(self.scrabble.df, self.name)
+        return self.scrabble._wrap(indexer[key])
 
-class Scrabble(pd.DataFrame):
-    _metadata = [
-        "display_columns",
-    ]
+    def __setitem__(self, key, value):
+        getattr(self.scrabble.df, self.name)[key] = value
 
-    def __init__(self, *args, display_columns=None, **kwargs):
+
+class Scrabble:
+    # Attributes stored on the wrapper itself; any other attribute
+    # assignment is forwarded to the wrapped DataFrame
+    _own_attributes = {
+        'df',
+        'display_columns',
+        '_display_columns',
+        '_display_cache',
+        '_derived_cache',
+    }
+    # DataFrame indexers whose results are wrapped back into a Scrabble
+    _indexers = {'loc', 'iloc', 'at', 'iat'}
+
+    def __init__(self, df=None, display_columns=None):
         """
-        Initialize the Scrabble DataFrame with optional display columns.
-        If the first argument is an existing Scrabble instance,
-        preserve its metadata.
+        Wrap a DataFrame of words with optional display columns.
+        If df is an existing Scrabble instance, preserve its metadata.
         """
-        super().__init__(*args, **kwargs)
-
-        # Check if the first argument is a Scrabble instance and
-        # preserve its metadata
-        if args and isinstance(args[0], Scrabble):
-            existing_df = args[0]
+        # Check if df is a Scrabble instance and preserve its metadata
+        if isinstance(df, Scrabble):
             if display_columns is None:
-                display_columns = existing_df.display_columns
+                display_columns = df.display_columns
+            # A shallow copy, so adding columns does not change the original
+            df = df.df.copy(deep=False)
+        if not isinstance(df, pd.DataFrame):
+            df = pd.DataFrame(df)
 
-        # Set display_columns either from the passed argument
-        # or the existing instance
+        self.df = df
         self.display_columns = display_columns
+        self._derived_cache = None
+
+    @classmethod
+    def from_raw(cls, df, display_columns=None):
+        """
+        Create a Scrabble DataFrame from raw data, setting 'word' as the index
+        if it exists in the DataFrame.
+        """
+        if 'word' in df.columns:
+            df = df.set_index('word')
+        return cls(df, display_columns=display_columns)
+
+    def __getattr__(self, name):
+        """
+        Delegate attribute access to the wrapped DataFrame. Methods returning
+        a DataFrame return a Scrabble with the same display columns instead.
+        """
+        if name in self._own_attributes or name.startswith('__'):
+            raise AttributeError(name)
+        if name in self._indexers:
+            return ScrabbleIndexer(self, name)
+        attr = getattr(self.df, name)
+        if not isinstance(attr, MethodType):
+            return attr
+
+        @wraps(attr)
+        def method(*args, **kwargs):
+            return self._wrap(attr(*args, **kwargs))
+
+        return method
+
+    def __setattr__(self, name, value):
+        if name in self._own_attributes:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.df, name, value)
+
+    def __getitem__(self, key):
+        return self._wrap(self.df[key])
 
-        # Automatically set 'word' as the index if it exists in the DataFrame
-        if 'word' in self.columns:
-            self.set_index('word', inplace=True)
+    def __setitem__(self, key, value):
+        self.df[key] = value
+
+    def __len__(self):
+        return len(self.df)
+
+    def __iter__(self):
+        return iter(self.df)
+
+    def __contains__(self, key):
+        return key in self.df
+
+    def _wrap(self, result):
+        """Wrap a DataFrame result, keeping the display columns."""
+        if isinstance(result, pd.DataFrame):
+            return Scrabble(result, display_columns=self.display_columns)
+        return result
 
     @property
-    def _constructor(self):
-        return Scrabble
+    def display_columns(self):
+        """Columns shown by repr, or None to show all of them."""
+        return self._display_columns
+
+    @display_columns.setter
+    def display_columns(self, columns):
+        self._display_columns = None if columns is None else list(columns)
+        self._display_cache = None
+
+    def _available_display_columns(self):
+        """
+        Return the display columns present in the DataFrame, cached until
+        either the display columns or the DataFrame columns change.
+        """
+        cache = self._display_cache
+        if cache is None or cache[0] is not self.df.columns:
+            available = [
+                col for col in self.display_columns if col in self.df.columns
+            ]
+            cache = (self.df.columns, available)
+            self._display_cache = cache
+        return cache[1]
+
+    def _derived(self, name, build):
+        """
+        Return an array derived from the words in the index, calling `build`
+        the first time it is needed. The cache is reset when the index changes.
+        """
+        cache = self._derived_cache
+        if cache is None or cache[0] is not self.df.index:
+            cache = (self.df.index, {})
+            self._derived_cache = cache
+        arrays = cache[1]
+        if name not in arrays:
+            arrays[name] = build()
+        return arrays[name]
+
+    @property
+    def _char_matrix(self):
+        """Words encoded as a zero-padded (n_words, max_len) uint8 matrix."""
+        return self._derived(
+            'char_matrix', lambda: encode_words(self.df.index)
+        )
+
+    @property
+    def _letter_counts(self):
+        """Letter counts of every word, shape (n_words, 27)."""
+        return self._derived(
+            'letter_counts', lambda: count_letters(self._char_matrix)
+        )
+
+    @property
+    def _word_lengths(self):
+        """Length of every word."""
+        return self._derived(
+            'word_lengths', lambda: (self._char_matrix != 0).sum(axis=1)
+        )
+
+    @property
+    def _length_buckets(self):
+        """Map each word length to the row positions and char matrix."""
+        def build():
+            char_mat = self._char_matrix
+            lengths = self._word_lengths
+            buckets = {}
+            for length in np.unique(lengths):
+                rows = np.flatnonzero(lengths == length)
+                buckets[int(length)] = (rows, char_mat[rows, :length])
+            return buckets
+
+        return self._derived('length_buckets', build)
 
     @classmethod
     def load_zyzzyva_lexicon(cls, filepath):
         """
         Load Zyzzyva lexicon into DataFrame with columns:
-        word, definition, forms.
+        word, definition, forms (comma-separated).
         """
         try:
+            # Text mode keeps the locale encoding and universal newlines
             with open(filepath, 'r') as file:
-                lines = file.readlines()
-
-            data = []
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                parts = line.split(' ', 1)
-                word = parts[0].strip()
-                definition = None
-                forms_list = []
-
-                if len(parts) > 1:
-                    if '[' in parts[1] and ']' in parts[1]:
-                        definition, forms = parts[1].rsplit('[', 1)
-                        forms = forms.strip('[]')
-                        forms_list = [
-                            form.strip() for form in forms.split(',')
-                        ]
-                    else:
-                        definition = parts[1].strip()
-                data.append([word, definition, forms_list])
-
-            words_df = pd.DataFrame(
-                data, columns=['word', 'definition', 'forms']
+                data = file.read()
+
+            words_df = pa.table(
+                parse_zyzzyva(data), names=['word', 'definition', 'forms']
+            ).to_pandas()
+            # Text is stored as Arrow strings; forms are kept as the raw
+            # comma-separated string, see iter_forms and forms_arrays
+            text_columns = ['definition', 'forms']
+            words_df[text_columns] = (
+                words_df[text_columns]
+                .replace('', None)
+                .astype('string[pyarrow]')
             )
-            return cls(words_df)
+            return cls.from_raw(words_df)
         except Exception as e:
             print(f"Error loading lexicon: {e}")
             return cls()
@@ -172,65 +528,98 @@ class Scrabble(pd.DataFrame):
         Merge CSW and NWL lexicons; add 'csw_only' and 'nwl_only' columns.
         Coalesce 'definition' columns into one.
         """
-        merged_df = pd.merge(
-            csw_lexicon, nwl_lexicon,
-            how='outer',
-            left_index=True,
-            right_index=True,
-            suffixes=('_csw', '_nwl'),
-            indicator='merge_indicator'
+        # Outer-join the word indices; a row position of -1 marks a word
+        # missing from that lexicon
+        words, csw_rows, nwl_rows = csw_lexicon.index.join(
+            nwl_lexicon.index, how='outer', return_indexers=True
+        )
+        # No row positions are returned for an index already equal to the join
+        aligned = np.arange(len(words))
+        csw_rows = aligned if csw_rows is None else csw_rows
+        nwl_rows = aligned if nwl_rows is None else nwl_rows
+
+        # Take every column of both lexicons straight from the join rows
+        merged_df = pd.DataFrame(
+            {
+                f'{column}{suffix}': take(
+                    lexicon[column].array, rows, allow_fill=True
+                )
+                for lexicon, rows, suffix in [
+                    (csw_lexicon, csw_rows, '_csw'),
+                    (nwl_lexicon, nwl_rows, '_nwl'),
+                ]
+                for column in lexicon.columns
+            },
+            index=words,
         )
 
         # Coalesce the 'definition' columns
-        merged_df['definition'] = merged_df['definition_csw'].combine_first(
-            merged_df['definition_nwl']
+        merged_df['definition'] = (
+            merged_df.pop('definition_csw')
+            .combine_first(merged_df.pop('definition_nwl'))
+            .astype('string[pyarrow]')
         )
 
         # Add a column indicating if the word is exclusive to CSW or NWL
-        merged_df['csw_only'] = merged_df['merge_indicator'] == 'left_only'
-        merged_df['nwl_only'] = merged_df['merge_indicator'] == 'right_only'
-
-        # Drop unnecessary columns
-        merged_df.drop(
-            columns=['definition_csw', 'definition_nwl', 'merge_indicator'],
-            inplace=True
-        )
+        merged_df['csw_only'] = nwl_rows == -1
+        merged_df['nwl_only'] = csw_rows == -1
 
         return cls(merged_df)
 
     def add_points(self):
         """Calculate and add Scrabble points for each word."""
-        def calculate_points(word):
-            return sum(POINTS_EN.get(char.upper(), 0) for char in word)
+        self['points'] = POINTS_LUT[self._char_matrix].sum(
+            axis=1, dtype=np.int16
+        )
 
-        self['points'] = self.index.map(calculate_points)
+    def iter_forms(self, word, column='forms'):
+        """Yield the forms listed for a word, splitting them on demand."""
+        forms = self.df.at[word, column]
+        if isinstance(forms, str):
+            for form in forms.split(','):
+                yield form.strip()
+
+    def forms_arrays(self, column='forms'):
+        """
+        Return the forms of every word as one flat array plus offsets, so
+        that the forms of row i are flat[offsets[i]:offsets[i + 1]].
+        """
+        forms = self.df[column]
+        present = forms.notna().to_numpy()
+        counts = np.zeros(len(forms), dtype=np.intp)
+        counts[present] = forms[present].str.count(',') + 1
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        flat = np.array([], dtype=object)
+        if present.any():
+            flat = np.array(
+                re.split(r'\s*,\s*', ','.join(forms[present])), dtype=object
+            )
+        return flat, offsets
 
     def __repr__(self):
         """
         Display only selected columns if 'display_columns' is specified.
         Only the columns that exist in the DataFrame are displayed.
         """
-        if self.display_columns:
-            # Ensure that display_columns is a list
-            self.display_columns = list(self.display_columns)
-            # Ensure that the specified columns exist in the DataFrame
-            available_columns = [
-                col for col in self.display_columns if col in self.columns
-            ]
-            if available_columns:
-                return super(Scrabble, self[available_columns]).__repr__()
-            else:
-                raise ValueError(
-                    f"None of the columns in selected display column(s) "
-                    f"{self.display_columns} are present in the data. "
-                )
-        else:
-            return super().__repr__()
+        if not self.display_columns:
+            return repr(self.df)
+
+        available_columns = self._available_display_columns()
+        if not available_columns:
+            raise ValueError(
+                f"None of the columns in selected display column(s) "
+                f"{self.display_columns} are present in the data. "
+            )
+        if available_columns == list(self.df.columns):
+            return repr(self.df)
+        return repr(self.df[available_columns])
 
     def match(self, pattern):
         """
         Match rows using a regex, a 'Scrabble regex' (underscores), or a letter
-        rack with '?' as blanks.
+        rack with '?' as blanks. Patterns made only of letters and '?' are
+        racks; anything else is treated as a regex.
 
         Parameters:
         - pattern (str): A regex, 'Scrabble regex', or rack of letters.
@@ -238,12 +627,15 @@ class Scrabble(pd.DataFrame):
         Returns:
         - Scrabble: DataFrame with filtered words.
 
+        Raises:
+        - re.error: If a pattern that is not a rack is not a valid regex.
+
         Examples:
         1. **Regex Match:**
            Use a regex pattern to match words that start with 'A' and end with 'Z':
            >>> regex_df = scrabble_df.match(r'^A.*Z$')
 
-           This matches words like "AMAZE" or "ABUZZ".
+           This matches words like "ABUZZ".
 
         2. **Scrabble Regex (Fixed Positions):**
            Use underscores (`_`) to represent fixed positions:
@@ -258,26 +650,41 @@ class Scrabble(pd.DataFrame):
 
            Finds words like "ALLAY" or "ALARM" using 'L', 'A', 'L', 'L', and two blanks.
         """
-        try:
-            re.compile(pattern)
-        except re.error:
-            pass
-
-        if '_' in pattern:
-            pattern = pattern.replace('_', '.{1}').upper()
-            pattern = f"^{pattern}$"
-        else:
+        pattern = pattern.upper()
+        if RACK_PATTERN.fullmatch(pattern):
             return self.match_rack(pattern)
+        if POSITION_PATTERN.fullmatch(pattern):
+            return self.match_positions(pattern)
 
-        return self[self.index.str.match(pattern)]
+        return self[self.df.index.str.match(compile_pattern(pattern))]
+
+    def match_positions(self, pattern):
+        """Match words using letters at fixed positions, with '_' as any."""
+        pattern = pattern.upper()  # Also a public entry point besides match
+        bucket = self._length_buckets.get(len(pattern))
+        if bucket is None:
+            return self._wrap(self.df.iloc[[]])
+
+        rows, char_mat = bucket
+        positions = [i for i, char in enumerate(pattern) if char != '_']
+        letters = np.frombuffer(pattern.encode(), dtype=np.uint8)[positions]
+        mask = (char_mat[:, positions] == letters).all(axis=1)
+        return self._wrap(self.df.iloc[rows[mask]])
 
     def match_rack(self, rack):
         """Match words using a rack of letters with '?' as blanks."""
-        rack_counter = Counter(rack.upper())
-
-        def can_form(word):
-            word_counter = Counter(word.upper())
-            deficit = word_counter - rack_counter
-            return sum(deficit.values()) <= rack_counter.get('?', 0)
+        rack = rack.upper()  # Also a public entry point besides match
+        if not RACK_PATTERN.fullmatch(rack):
+            raise ValueError(
+                f"Invalid rack {rack!r}: only letters A-Z and '?' blanks "
+                f"are allowed."
+            )
+        rack_vec = count_letters(encode_words([rack]))[0].astype(np.int16)
+        rack_vec[26] = 0  # Blanks are counted separately
 
-        return self[self.index.map(can_form)]
+        # Only words no longer than the rack can be formed from it
+        candidates = np.flatnonzero(self._word_lengths <= len(rack))
+        mask = rack_mask(
+            self._letter_counts[candidates], rack_vec, rack.count('?')
+        )
+        return self._wrap(self.df.iloc[candidates[mask]])